@@ -5,6 +5,8 @@ collaborative filtering and content-based filtering models.
 """
 
 import os
+import logging
+from functools import partial
 from pathlib import Path
 import pickle
 import pandas as pd
@@ -12,6 +14,12 @@ import streamlit as st
 from dotenv import load_dotenv
 from  src.project_pipeline.aws_utils import load_from_s3
 import src.project_pipeline.load_config as lc
+from src.project_pipeline.model_router import ModelRouter, summarize_metrics
+from src.project_pipeline.recommend import (cbf_recommendations, cf_recommendations,
+                                            popular_recommendations)
+from src.project_pipeline import save_artifacts
+
+logger = logging.getLogger(__name__)
 
 # Load configuration and environment variables
 load_dotenv()
@@ -24,6 +32,13 @@ aws_secret_access_key = os.getenv("aws_secret_access_key")
 aws_region = os.getenv("aws_region")
 bucket_name = config["aws"]["bucket_name"]
 
+ARTIFACTS = Path("artifacts")
+DATA_PATH = ARTIFACTS / "Data" / "final_df.pkl"
+MODELS = {
+    "Collaborative Filtering": ("Collaborative_Filtering", "best_cf.pkl", cf_recommendations),
+    "Content Based Filtering": ("Content_Based_Filtering", "best_cbf.pkl", cbf_recommendations)
+}
+
 @st.cache_resource
 def load_model(model_path):
     """
@@ -50,118 +65,130 @@ def load_data(data_path):
     """
     return pd.read_pickle(data_path)
 
-def make_content_based_predictions(user_id, df_with_one_hot, pipeline):
+def model_version(role):
     """
-    Generate content-based recommendations for a given user.
+    Read a model version from the config.
 
     Parameters:
-    - user_id (str): The ID of the user for whom recommendations are to be generated.
-    - df_with_one_hot (pd.DataFrame): The dataframe containing one-hot encoded data.
-    - pipeline: The trained content-based filtering pipeline.
+    - role (str): "primary" or "candidate".
 
     Returns:
-    - list: A list of recommendation dictionaries, 
-    each containing "product_id" and "predicted_rating".
+    - str: The version as a string, since YAML reads e.g. 2 as an int,
+    or None for the unversioned model.
     """
-    all_product_ids = df_with_one_hot["product_id"].unique()
-
-    user_interactions = df_with_one_hot[df_with_one_hot["user_id"] == user_id]["product_id"].values
-    unrated_product_ids = [product_id for product_id in all_product_ids
-                            if product_id not in user_interactions]
+    version = config["model_versions"][role]
+    return None if version is None else str(version)
 
-    x_new = df_with_one_hot[df_with_one_hot["product_id"].isin(unrated_product_ids)]
-    x_new = x_new.drop(columns=["rating", "user_id"])
-
-    predictions = pipeline.predict(x_new)
-
-    predicted_ratings = pd.DataFrame({"product_id": x_new["product_id"],
-                                       "predicted_rating": predictions})
-    predicted_ratings.sort_values(by="predicted_rating", ascending=False, inplace=True)
-    predicted_ratings = predicted_ratings.drop_duplicates(subset=["product_id"])
-
-    num_recs = 10
-    recommendations = []
-    for _, row in predicted_ratings.head(num_recs).iterrows():
-        recommendation = {
-            "product_id": row["product_id"],
-            "predicted_rating": row["predicted_rating"]
-        }
-        recommendations.append(recommendation)
+def s3_prefixes():
+    """
+    Build the S3 key prefixes of the data and of the configured primary and
+    candidate versions of every model type.
 
-    return recommendations
+    Returns:
+    - list: The S3 key prefixes to download.
+    """
+    prefix = config["aws"]["prefix"]
+    prefixes = [f"{prefix}_Data/"]
+    for model_dir, model_file, _ in MODELS.values():
+        for version in dict.fromkeys([model_version("primary"), model_version("candidate")]):
+            if version is None:
+                prefixes.append(f"{prefix}_{model_dir}/{model_file}")
+            else:
+                prefixes.append(f"{prefix}_{model_dir}/{version}/")
+    return prefixes
 
-def generate_cf_recommendations(model, user_id, df_with_one_hot):
+def load_router(model_choice):
     """
-    Generates collaborative filtering recommendations based on the selected model and user input.
+    Build a router serving the primary version of the selected model type,
+    shadow-scoring the candidate version if one is configured.
 
     Parameters:
-    - model: The collaborative filtering model.
-    - user_id (str): The ID of the user for whom recommendations are to be generated.
-    - df_with_one_hot (pd.DataFrame): The dataframe containing one-hot encoded data.
+    - model_choice (str): The choice of model for generating recommendations.
 
     Returns:
-    None
+    - ModelRouter: The router, or None if the primary model file is not found.
     """
-    predictions = []
-    for product_id in df_with_one_hot["product_id"].unique():
-        pred = model.predict(uid=user_id, iid=str(product_id))
-        predictions.append((product_id, pred.est))
-
-
+    model_dir, model_file, _ = MODELS[model_choice]
+    serving = config["serving"]
 
-    predicted_ratings = pd.DataFrame(predictions, columns=["product_id", "predicted_rating"])
-    predicted_ratings.sort_values(by="predicted_rating", ascending=False, inplace=True)
-    predicted_ratings = predicted_ratings.drop_duplicates(subset=["product_id"])
+    primary_path = save_artifacts.model_path(ARTIFACTS, model_dir, model_file,
+                                             model_version("primary"))
+    if not primary_path.exists():
+        st.error(f"Model file not found: {primary_path}")
+        return None
+    return _load_router(model_choice, model_version("primary"), model_version("candidate"),
+                        serving["num_recs"], serving["latency_budget_ms"],
+                        serving["primary_workers"], serving["shadow_workers"],
+                        serving["metrics_path"])
 
-    num_recs = 10
-    top_recommendations = predicted_ratings.head(num_recs)
-    st.write(f"Top {num_recs} recommendations for user {user_id}:")
-    st.dataframe(top_recommendations)
 
-
-def generate_cbf_recommendations(user_id, df_with_one_hot):
+@st.cache_resource
+def _load_router(model_choice, primary_version, candidate_version, num_recs,
+                 latency_budget_ms, primary_workers, shadow_workers, metrics_path):
     """
-    Generates content-based filtering recommendations based on the selected model and user input.
-
-    Parameters:
-    - user_id (str): The ID of the user for whom recommendations are to be generated.
-    - df_with_one_hot (pd.DataFrame): The dataframe containing one-hot encoded data.
-
-    Returns:
-    None
+    Load the model versions and build a router, cached across Streamlit reruns
+    so the thread pools and recorded metrics persist.
     """
-    content_based_model_path = Path("artifacts/Content_Based_Filtering/best_cbf.pkl")
-    if not content_based_model_path.exists():
-        st.error(f"Model file not found: {content_based_model_path}")
-        return
+    model_dir, model_file, recommender = MODELS[model_choice]
+    df_with_one_hot = load_data(DATA_PATH)
+
+    primary_model = load_model(save_artifacts.model_path(ARTIFACTS, model_dir, model_file,
+                                                         primary_version))
+    primary = partial(recommender, primary_model, data=df_with_one_hot, num_recs=num_recs)
+
+    candidate = None
+    if candidate_version is not None:
+        candidate_path = save_artifacts.model_path(ARTIFACTS, model_dir, model_file,
+                                                   candidate_version)
+        if candidate_path.exists():
+            candidate_model = load_model(candidate_path)
+            candidate = partial(recommender, candidate_model, data=df_with_one_hot,
+                                num_recs=num_recs)
+        else:
+            logger.warning("Candidate model file not found: %s", candidate_path)
 
-    content_based_pipeline = load_model(content_based_model_path)
-    st.write("Content Based Filtering model loaded successfully!")
-    recommendations = make_content_based_predictions(user_id, df_with_one_hot,
-                                                     content_based_pipeline)
-    num_recs = 10
-    st.write(f"Top {num_recs} recommendations for user {user_id}:")
-    st.write(pd.DataFrame(recommendations))
+    popular = popular_recommendations(df_with_one_hot, num_recs)
+    return ModelRouter(model_dir, primary, primary_version or "default",
+                       lambda user_id: popular,
+                       latency_budget_ms,
+                       candidate=candidate,
+                       candidate_version=candidate_version,
+                       primary_workers=primary_workers,
+                       shadow_workers=shadow_workers,
+                       metrics_path=Path(metrics_path))
 
 
-def generate_recommendations(model_choice, user_id, model, df_with_one_hot):
+def generate_recommendations(router, user_id):
     """
-    Generates recommendations based on the selected model and user input.
+    Generates recommendations with the router and displays them.
 
     Parameters:
-    - model_choice (str): The choice of model for generating recommendations.
+    - router (ModelRouter): The router serving the selected model type.
     - user_id (str): The ID of the user for whom recommendations are to be generated.
-    - model: The collaborative filtering model object.
-    - df_with_one_hot (pd.DataFrame): The dataframe containing one-hot encoded data.
 
     Returns:
     None
     """
-    if model_choice == "Collaborative Filtering":
-        generate_cf_recommendations(model, user_id, df_with_one_hot)
-    elif model_choice == "Content Based Filtering":
-        generate_cbf_recommendations(user_id, df_with_one_hot)
-
+    recommendations, record = router.recommend(user_id)
+    if record["role"] == "fallback":
+        st.warning("The model exceeded its latency budget, showing the most popular products.")
+    st.write(f"Top {len(recommendations)} recommendations for user {user_id}:")
+    st.dataframe(recommendations)
+    st.caption(f"Served by {record['role']} model {record['version']} "
+               f"in {record['latency_ms']:.0f} ms")
+    if router.shadow_dropped:
+        st.caption(f"{router.shadow_dropped} shadow scores of candidate model "
+                   f"{router.candidate_version} dropped because the shadow pool was busy")
+
+
+def show_version_metrics():
+    """
+    Displays the recorded latency and quality metrics per model version.
+    """
+    metrics_path = Path(config["serving"]["metrics_path"])
+    if metrics_path.exists():
+        with st.expander("Model version metrics"):
+            st.dataframe(summarize_metrics(pd.read_csv(metrics_path)))
 
 
 def main():
@@ -170,42 +197,31 @@ def main():
     """
     st.title("Recommender System Interface")
 
-    data_path = Path("artifacts/Data/final_df.pkl")
-    if data_path.exists():
-        df_with_one_hot = load_data(data_path)
-    else:
+    if not DATA_PATH.exists():
         st.error("Data file not found. Please check your setup.")
         return
 
     if st.button("Download Artifacts from S3"):
-        target_directories = ["artifacts_Collaborative_Filtering",
-                        "artifacts_Content_Based_Filtering",
-                              "artifacts_Data"]
         load_from_s3(aws_access_key, aws_secret_access_key,
-                     aws_region, bucket_name, target_directories)
+                     aws_region, bucket_name, s3_prefixes())
         st.session_state["models_downloaded"] = True
 
     # Check if models are downloaded before proceeding
     if st.session_state.get("models_downloaded", False):
         model_choice = st.selectbox("Select Model",
                                     ["Collaborative Filtering", "Content Based Filtering"])
-        model_paths = {
-            "Collaborative Filtering": Path("artifacts/Collaborative_Filtering/best_cf.pkl"),
-            "Content Based Filtering": Path("artifacts/Content_Based_Filtering/best_cbf.pkl")
-        }
-        if model_paths[model_choice].exists():
-            model = load_model(model_paths[model_choice])
-            st.write(f"{model_choice} model loaded successfully!")
-        else:
-            st.error(f"Model file not found: {model_paths[model_choice]}")
+        router = load_router(model_choice)
+        if router is None:
             return
+        st.write(f"{model_choice} model loaded successfully!")
 
         user_id = st.text_input("Enter User ID:")
         if st.button("Generate Recommendations"):
             if user_id:
-                generate_recommendations(model_choice, user_id, model, df_with_one_hot)
+                generate_recommendations(router, user_id)
             else:
                 st.error("Please enter a valid User ID.")
+        show_version_metrics()
 
 
 
@@ -0,0 +1,153 @@
+"""
+EDA Benchmark Module
+This module times the text cleaning and the preprocessing backends on a synthetic
+Amazon-like dataset and checks that every backend produces the same output as the
+pandas backend.
+"""
+
+import argparse
+import logging
+import os
+import time
+import pandas as pd
+from src.project_pipeline import eda, eda_backend
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def make_data(n_rows: int) -> pd.DataFrame:
+    """Builds a synthetic DataFrame shaped like the raw Amazon product data.
+
+    Args:
+        n_rows (int): Number of product rows to generate.
+
+    Returns:
+        pd.DataFrame: Raw DataFrame with the same columns and formats as amazon.csv.
+    """
+    rows = []
+    for i in range(n_rows):
+        rows.append({
+            'product_id': f'B{i:09d}',
+            'product_name': f'Product {i}, USB-C Cable (1.5m)',
+            'category': f'Computers&Accessories|Accessories|Cables|Type{i % 7}',
+            'discounted_price': f'₹{1000 + i % 500:,}',
+            'actual_price': f'₹{2500 + i % 900:,}',
+            'discount_percentage': f'{i % 90}%',
+            'rating': '|' if i % 97 == 0 else str(3 + (i % 20) / 10),
+            'rating_count': f'{10000 + i:,}',
+            'about_product': 'Fast charging! Durable: braided & tangle-free... (2-pack)',
+            'user_id': ','.join(f'U{i}{j}' for j in range(3)),
+            'user_name': ','.join(f'Name{i}{j}' for j in range(3)),
+            'review_id': ','.join(f'R{i}{j}' for j in range(3)),
+            'review_title': 'Great cable!,Works well.,Not bad :)',
+            'review_content': 'Really good; charges quickly. Would buy again!!',
+            'img_link': f'https://example.com/img/{i}.jpg',
+            'product_link': f'https://example.com/p/{i}',
+        })
+    return pd.DataFrame(rows)
+
+
+def legacy_clean_text(data: pd.DataFrame, regex: bool) -> pd.DataFrame:
+    """Cleans the text columns with the chained str.replace passes used before
+    eda.clean_text.
+
+    Args:
+        data (pd.DataFrame): Raw input DataFrame.
+        regex (bool): False reproduces the previous code, which on pandas 2 treats the
+            pattern as a literal string and strips nothing; True is its intended behaviour.
+
+    Returns:
+        pd.DataFrame: DataFrame with cleaned text columns.
+    """
+    for column in ['about_product', 'review_content']:
+        data[column] = data[column].str.replace(r'[^\w\s]', '', regex=regex).str.lower()
+    data['review_title'] = data['review_title'].str.replace(r'[^\w\s,]', '',
+                                                            regex=regex).str.lower()
+    return data
+
+
+def clean_text(data: pd.DataFrame) -> pd.DataFrame:
+    """Cleans the text columns with eda.clean_text and its precompiled patterns.
+
+    Args:
+        data (pd.DataFrame): Raw input DataFrame.
+
+    Returns:
+        pd.DataFrame: DataFrame with cleaned text columns.
+    """
+    data['about_product'] = eda.clean_text(data['about_product'], eda.PUNCTUATION_PATTERN)
+    data['review_title'] = eda.clean_text(data['review_title'], eda.REVIEW_TITLE_PATTERN)
+    data['review_content'] = eda.clean_text(data['review_content'], eda.PUNCTUATION_PATTERN)
+    return data
+
+
+def time_text_cleaning(data: pd.DataFrame) -> dict:
+    """Times the text cleaning variants and checks that the ones stripping punctuation
+    agree.
+
+    Args:
+        data (pd.DataFrame): Raw input DataFrame, copied before each run.
+
+    Returns:
+        dict: Elapsed seconds per cleaning variant.
+    """
+    variants = {
+        'previous code (no-op on pandas 2)': lambda frame: legacy_clean_text(frame, False),
+        'chained str.replace, regex=True': lambda frame: legacy_clean_text(frame, True),
+        'eda.clean_text': clean_text,
+    }
+    timings, results = {}, {}
+    for name, variant in variants.items():
+        frame = data.copy()
+        start = time.perf_counter()
+        results[name] = variant(frame)
+        timings[name] = time.perf_counter() - start
+    pd.testing.assert_frame_equal(results['eda.clean_text'],
+                                  results['chained str.replace, regex=True'])
+    return timings
+
+
+def time_backend(data: pd.DataFrame, backend: str, n_workers: int) -> tuple:
+    """Times a single preprocessing run.
+
+    Args:
+        data (pd.DataFrame): Raw input DataFrame, copied before the run.
+        backend (str): Execution backend to use.
+        n_workers (int): Number of worker processes.
+
+    Returns:
+        tuple: Elapsed seconds and the preprocessed DataFrame.
+    """
+    start = time.perf_counter()
+    result = eda_backend.preprocess(data.copy(), backend, n_workers)
+    return time.perf_counter() - start, result
+
+
+def main():
+    """
+    Main function to run the benchmark.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=5000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    data = make_data(args.rows)
+    for name, elapsed in time_text_cleaning(data).items():
+        logger.info('text cleaning, %s: %.3fs', name, elapsed)
+
+    baseline_time, expected = time_backend(data, 'pandas', 1)
+    logger.info('pandas: %.2fs', baseline_time)
+
+    worker_counts = sorted({2 ** i for i in range(args.max_workers.bit_length())
+                            if 2 ** i <= args.max_workers} | {args.max_workers})
+    for n_workers in worker_counts:
+        elapsed, result = time_backend(data, 'process_pool', n_workers)
+        pd.testing.assert_frame_equal(result, expected)
+        logger.info('process_pool, %d workers: %.2fs (%.2fx speedup)',
+                    n_workers, elapsed, baseline_time / elapsed)
+
+
+if __name__ == "__main__":
+    main()
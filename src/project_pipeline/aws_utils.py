@@ -36,7 +36,9 @@ def upload_artifacts(access_key, secret_key, region, artifacts: Path, config: di
                 upload_files(file_path, prefix)
 
     def upload_file(file_path, prefix):
-        experiment_id = file_path.parent.stem
+        # Keep the model type and version in the key, e.g. artifacts_Collaborative_Filtering/v2/
+        relative_dir = file_path.parent.relative_to(artifacts)
+        experiment_id = relative_dir.as_posix() if relative_dir.parts else artifacts.stem
         s3_key = f"{prefix}_{experiment_id}/{file_path.name}"
         try:
             s3_client.upload_file(str(file_path), bucket_name, s3_key)
@@ -1,7 +1,26 @@
 """ Module to perform EDA"""
-from typing import Tuple
+import re
+from typing import Optional, Tuple
 import pandas as pd
 
+PRICE_PATTERN = re.compile(r'[₹,]')
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+# Review titles of different users are separated by commas, which split_users relies on
+REVIEW_TITLE_PATTERN = re.compile(r'[^\w\s,]')
+
+
+def clean_text(text: pd.Series, pattern: re.Pattern) -> pd.Series:
+    """Removes all matches of a pattern from a text column and lowercases it.
+
+    Args:
+        text (pd.Series): Column of strings.
+        pattern (re.Pattern): Precompiled pattern of characters to remove.
+
+    Returns:
+        pd.Series: Cleaned, lowercased column.
+    """
+    return text.str.replace(pattern, '', regex=True).str.lower()
+
 
 def data_preprocess(data: pd.DataFrame) -> pd.DataFrame:
     """Preprocesses the input DataFrame.
@@ -14,21 +33,21 @@ def data_preprocess(data: pd.DataFrame) -> pd.DataFrame:
     """
     data.fillna(value=pd.NA, inplace=True)  # Fill missing values with 'NA'
     data['discounted_price'] = data['discounted_price'].str.replace(
-        '₹', '').str.replace(',', '').astype(float)
+        PRICE_PATTERN, '', regex=True).astype(float)
     data['actual_price'] = data['actual_price'].str.replace(
-        '₹', '').str.replace(',', '').astype(float)
+        PRICE_PATTERN, '', regex=True).astype(float)
 
     data['rating'] = pd.to_numeric(data['rating'], errors='coerce')
     data.dropna(inplace=True)
 
-    data['rating_count'] = data['rating_count'].str.replace(',', '').astype(int)
+    data['rating_count'] = data['rating_count'].str.replace(',', '', regex=False).astype(int)
     data['product_name'] = data['product_name'].str.lower()
 
     data['discount_percentage'] = data['discount_percentage'].str.rstrip('%').astype(float)
 
-    data['about_product'] = data['about_product'].str.replace(r'[^\w\s]', '').str.lower()
-    data['review_title'] = data['review_title'].str.replace(r'[^\w\s]', '').str.lower()
-    data['review_content'] = data['review_content'].str.replace(r'[^\w\s]', '').str.lower()
+    data['about_product'] = clean_text(data['about_product'], PUNCTUATION_PATTERN)
+    data['review_title'] = clean_text(data['review_title'], REVIEW_TITLE_PATTERN)
+    data['review_content'] = clean_text(data['review_content'], PUNCTUATION_PATTERN)
 
     return data
 
@@ -70,6 +89,42 @@ def extract_first_last(category: str) -> Tuple[str, str]:
     return first_item, last_item
 
 
+def split_categories(data: pd.DataFrame) -> pd.DataFrame:
+    """Replaces the 'category' column with its first and last categories.
+
+    Args:
+        data (pd.DataFrame): Input DataFrame with a 'category' column.
+
+    Returns:
+        pd.DataFrame: DataFrame with 'First_category' and 'Last_category' columns.
+    """
+    data[['First_category', 'Last_category']] = data['category'].apply(lambda x:
+                                                    pd.Series(extract_first_last(x)))
+    data.drop('category', axis=1, inplace=True)
+    return data
+
+
+def transform_partition(data: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """Runs the row-wise preprocessing steps on a partition of the raw data.
+
+    Every step only looks at a single row, so partitions can be processed
+    independently and concatenated in their original order.
+
+    Args:
+        data (pd.DataFrame): Partition of the raw input DataFrame.
+
+    Returns:
+        pd.DataFrame: Preprocessed partition with one row per user, or None if
+        no rows survive preprocessing.
+    """
+    processed = data_preprocess(data)
+    if processed.empty:
+        return None
+    user_split = pd.concat([split_users(row)
+                            for _, row in processed.iterrows()], ignore_index=True)
+    return split_categories(user_split)
+
+
 def one_hot_encoding(data: pd.DataFrame) -> pd.DataFrame:
     """Performs one-hot encoding on the 'First_category' column of the DataFrame.
 
@@ -0,0 +1,74 @@
+""" Module to run the EDA preprocessing on a configurable execution backend"""
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+import pandas as pd
+from src.project_pipeline import eda
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('pandas', 'process_pool')
+
+
+def partition_data(data: pd.DataFrame, n_partitions: int) -> List[pd.DataFrame]:
+    """Splits a DataFrame into contiguous row partitions of roughly equal size.
+
+    Args:
+        data (pd.DataFrame): Input DataFrame.
+        n_partitions (int): Number of partitions to create.
+
+    Returns:
+        List[pd.DataFrame]: Non-empty partitions in their original row order.
+    """
+    n_partitions = max(1, min(n_partitions, len(data)))
+    size, remainder = divmod(len(data), n_partitions)
+    partitions = []
+    start = 0
+    for i in range(n_partitions):
+        stop = start + size + (1 if i < remainder else 0)
+        partitions.append(data.iloc[start:stop])
+        start = stop
+    return partitions
+
+
+def preprocess(data: pd.DataFrame,
+               backend: str = 'pandas',
+               n_workers: Optional[int] = None,
+               n_partitions: Optional[int] = None) -> pd.DataFrame:
+    """Runs the row-wise preprocessing steps with the selected backend.
+
+    The 'pandas' backend processes the whole DataFrame in the current process.
+    The 'process_pool' backend splits it into partitions and processes them on
+    a pool of worker processes; the output is identical to the 'pandas' backend.
+
+    Args:
+        data (pd.DataFrame): Raw input DataFrame.
+        backend (str): Execution backend, one of 'pandas' or 'process_pool'.
+        n_workers (Optional[int]): Number of worker processes. Defaults to all cores.
+        n_partitions (Optional[int]): Number of partitions. Defaults to n_workers.
+
+    Returns:
+        pd.DataFrame: Preprocessed DataFrame with one row per user.
+
+    Raises:
+        ValueError: If the backend is unknown or no rows survive preprocessing.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown preprocessing backend '{backend}', "
+                         f"expected one of {BACKENDS}")
+
+    if backend == 'pandas':
+        parts = [eda.transform_partition(data)]
+    else:
+        n_workers = n_workers or os.cpu_count() or 1
+        partitions = partition_data(data, n_partitions or n_workers)
+        logger.info("Preprocessing %d partitions on %d workers", len(partitions), n_workers)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            parts = list(executor.map(eda.transform_partition, partitions))
+
+    parts = [part for part in parts if part is not None]
+    if not parts:
+        raise ValueError("No rows left after preprocessing: every row has a missing value "
+                         "or an unparseable rating")
+    return pd.concat(parts, ignore_index=True)
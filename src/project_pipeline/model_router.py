@@ -0,0 +1,232 @@
+""" Module to route recommendation requests between model versions"""
+import csv
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+METRIC_FIELDS = ['timestamp', 'model', 'user_id', 'role', 'version', 'timed_out',
+                 'latency_ms', 'mean_score', 'latency_diff_ms', 'score_diff', 'overlap']
+
+# Routers of different model types may share a metrics file, so appends are
+# serialized per file rather than per router
+_METRICS_LOCKS = {}
+_METRICS_LOCKS_GUARD = threading.Lock()
+
+
+def _metrics_lock(metrics_path: Path) -> threading.Lock:
+    """Returns the lock serializing appends to a metrics file."""
+    with _METRICS_LOCKS_GUARD:
+        return _METRICS_LOCKS.setdefault(metrics_path.resolve(), threading.Lock())
+
+
+class ModelRouter:
+    """Serves recommendations from a primary model version within a latency budget.
+
+    Requests that exceed the budget are answered by a fallback scorer. A primary score
+    still queued at that point is cancelled; one already running is recorded as timed
+    out with its actual latency once it finishes. If a candidate version is configured,
+    it is scored on a background thread pool once the primary result is available, and
+    its latency and score differences to the primary are recorded. At most
+    shadow_workers candidate scores are in flight; further ones are dropped and counted
+    in shadow_dropped.
+
+    Each scorer is a callable taking a user ID and returning a DataFrame with
+    "product_id" and "predicted_rating" columns.
+    """
+
+    def __init__(self,
+                 model: str,
+                 primary: Callable[[str], pd.DataFrame],
+                 primary_version: str,
+                 fallback: Callable[[str], pd.DataFrame],
+                 latency_budget_ms: float,
+                 candidate: Optional[Callable[[str], pd.DataFrame]] = None,
+                 candidate_version: Optional[str] = None,
+                 primary_workers: int = 4,
+                 shadow_workers: int = 2,
+                 metrics_path: Optional[Path] = None):
+        self.model = model
+        self.primary = primary
+        self.primary_version = primary_version
+        self.fallback = fallback
+        self.latency_budget_ms = latency_budget_ms
+        self.candidate = candidate
+        self.candidate_version = candidate_version
+        self.metrics_path = Path(metrics_path) if metrics_path else None
+        self.shadow_workers = shadow_workers
+        self.shadow_dropped = 0
+        self._shadow_slots = threading.BoundedSemaphore(shadow_workers)
+        self._shadow_dropped_lock = threading.Lock()
+        self._primary_pool = ThreadPoolExecutor(max_workers=primary_workers,
+                                                thread_name_prefix='primary')
+        self._shadow_pool = ThreadPoolExecutor(max_workers=shadow_workers,
+                                               thread_name_prefix='shadow')
+
+    def recommend(self, user_id: str) -> Tuple[pd.DataFrame, dict]:
+        """Generates recommendations for a user with the primary model or the fallback.
+
+        Args:
+            user_id (str): The ID of the user for whom recommendations are to be generated.
+
+        Returns:
+            Tuple[pd.DataFrame, dict]: The recommendations and the recorded metrics of
+            the request.
+        """
+        start = time.perf_counter()
+        future = self._primary_pool.submit(self.primary, user_id)
+        try:
+            recommendations = future.result(timeout=self.latency_budget_ms / 1000)
+        except FutureTimeoutError:
+            logger.warning("Primary model %s exceeded the %s ms latency budget for user %s, "
+                           "serving fallback", self.primary_version, self.latency_budget_ms,
+                           user_id)
+            if future.cancel():
+                # The primary never ran, so its latency is the time waited until cancelling
+                self._record(user_id, 'primary', self.primary_version,
+                             (time.perf_counter() - start) * 1000, None, timed_out=True)
+                self._submit_shadow(user_id, None, None)
+            else:
+                future.add_done_callback(partial(self._finish_primary, user_id, start))
+            recommendations = self.fallback(user_id)
+            latency_ms = (time.perf_counter() - start) * 1000
+            record = self._record(user_id, 'fallback', 'popularity', latency_ms,
+                                  recommendations)
+            return recommendations, record
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        record = self._record(user_id, 'primary', self.primary_version, latency_ms,
+                              recommendations, timed_out=False)
+        self._submit_shadow(user_id, recommendations, latency_ms)
+        return recommendations, record
+
+    def shutdown(self, wait: bool = False):
+        """Stops the thread pools.
+
+        Args:
+            wait (bool): Whether to wait for running primary and shadow scores to finish.
+        """
+        self._primary_pool.shutdown(wait=wait)
+        self._shadow_pool.shutdown(wait=wait)
+
+    def _finish_primary(self, user_id: str, start: float, future):
+        """Records a primary score that finished after the latency budget and shadow-scores
+        the candidate against it."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error("Primary model %s failed after the latency budget: %s",
+                         self.primary_version, error)
+            self._submit_shadow(user_id, None, None)
+            return
+        recommendations = future.result()
+        latency_ms = (time.perf_counter() - start) * 1000
+        self._record(user_id, 'primary', self.primary_version, latency_ms, recommendations,
+                     timed_out=True)
+        self._submit_shadow(user_id, recommendations, latency_ms)
+
+    def _submit_shadow(self, user_id: str, primary_recommendations: Optional[pd.DataFrame],
+                       primary_latency_ms: Optional[float]):
+        """Scores the candidate in the background if one is configured."""
+        if self.candidate is None:
+            return
+        if not self._shadow_slots.acquire(blocking=False):
+            with self._shadow_dropped_lock:
+                self.shadow_dropped += 1
+            logger.warning("Dropped shadow score of candidate model %s for user %s, "
+                           "%d shadow scores already in flight", self.candidate_version,
+                           user_id, self.shadow_workers)
+            return
+        shadow = self._shadow_pool.submit(self._shadow_score, user_id,
+                                          primary_recommendations, primary_latency_ms)
+        shadow.add_done_callback(self._finish_shadow)
+
+    def _finish_shadow(self, future):
+        """Frees the in-flight slot of a shadow score and logs its failure, which must
+        never affect the served response."""
+        self._shadow_slots.release()
+        error = future.exception()
+        if error is not None:
+            logger.error("Shadow scoring failed: %s", error)
+
+    def _shadow_score(self, user_id: str, primary_recommendations: Optional[pd.DataFrame],
+                      primary_latency_ms: Optional[float]) -> dict:
+        """Scores the candidate model and records its differences to the primary."""
+        start = time.perf_counter()
+        recommendations = self.candidate(user_id)
+        latency_ms = (time.perf_counter() - start) * 1000
+        return self._record(user_id, 'candidate', self.candidate_version, latency_ms,
+                            recommendations, primary_recommendations, primary_latency_ms)
+
+    def _record(self, user_id: str, role: str, version: str, latency_ms: Optional[float],
+                recommendations: Optional[pd.DataFrame],
+                primary_recommendations: Optional[pd.DataFrame] = None,
+                primary_latency_ms: Optional[float] = None,
+                timed_out: Optional[bool] = None) -> dict:
+        """Appends the metrics of a scored request to the metrics file."""
+        record = dict.fromkeys(METRIC_FIELDS)
+        record.update({
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'model': self.model,
+            'user_id': user_id,
+            'role': role,
+            'version': version,
+            'timed_out': timed_out,
+        })
+        if latency_ms is not None:
+            record['latency_ms'] = round(latency_ms, 3)
+        if recommendations is not None:
+            record['mean_score'] = float(recommendations['predicted_rating'].mean())
+        if primary_recommendations is not None:
+            primary_ids = set(primary_recommendations['product_id'])
+            shared_ids = primary_ids & set(recommendations['product_id'])
+            record['latency_diff_ms'] = round(latency_ms - primary_latency_ms, 3)
+            record['score_diff'] = float(record['mean_score']
+                                         - primary_recommendations['predicted_rating'].mean())
+            record['overlap'] = len(shared_ids) / len(primary_ids) if primary_ids else None
+
+        if self.metrics_path is not None:
+            with _metrics_lock(self.metrics_path):
+                write_header = not self.metrics_path.exists()
+                self.metrics_path.parent.mkdir(exist_ok=True, parents=True)
+                with open(self.metrics_path, 'a', newline='', encoding='utf8') as file:
+                    writer = csv.DictWriter(file, fieldnames=METRIC_FIELDS)
+                    if write_header:
+                        writer.writeheader()
+                    writer.writerow(record)
+        return record
+
+
+def summarize_metrics(metrics: pd.DataFrame) -> pd.DataFrame:
+    """Summarizes recorded request metrics per model type, role and model version.
+
+    Args:
+        metrics (pd.DataFrame): Metrics recorded by a ModelRouter, e.g. read from its
+            metrics file.
+
+    Returns:
+        pd.DataFrame: Request count, share of timed out requests, mean and p95 latency,
+        mean score, and mean latency difference, score difference and overlap with the
+        primary per model type, role and version.
+    """
+    metrics = metrics.assign(timed_out=metrics['timed_out'].map(
+        {True: 1.0, False: 0.0, 'True': 1.0, 'False': 0.0}))
+    grouped = metrics.groupby(['model', 'role', 'version'])
+    return pd.DataFrame({
+        'requests': grouped.size(),
+        'timeout_rate': grouped['timed_out'].mean(),
+        'mean_latency_ms': grouped['latency_ms'].mean(),
+        'p95_latency_ms': grouped['latency_ms'].quantile(0.95),
+        'mean_score': grouped['mean_score'].mean(),
+        'mean_latency_diff_ms': grouped['latency_diff_ms'].mean(),
+        'mean_score_diff': grouped['score_diff'].mean(),
+        'mean_overlap': grouped['overlap'].mean(),
+    }).reset_index()
@@ -0,0 +1,70 @@
+""" Module to generate top-N recommendations from trained models"""
+import pandas as pd
+
+
+def cf_recommendations(model, user_id: str, data: pd.DataFrame,
+                       num_recs: int = 10) -> pd.DataFrame:
+    """Generates collaborative filtering recommendations for a given user.
+
+    Args:
+        model: The trained collaborative filtering model.
+        user_id (str): The ID of the user for whom recommendations are to be generated.
+        data (pd.DataFrame): The dataframe containing one-hot encoded data.
+        num_recs (int): Number of recommendations to return.
+
+    Returns:
+        pd.DataFrame: Top recommendations with "product_id" and "predicted_rating" columns.
+    """
+    predictions = []
+    for product_id in data["product_id"].unique():
+        pred = model.predict(uid=user_id, iid=str(product_id))
+        predictions.append((product_id, pred.est))
+
+    predicted_ratings = pd.DataFrame(predictions, columns=["product_id", "predicted_rating"])
+    predicted_ratings.sort_values(by="predicted_rating", ascending=False, inplace=True)
+    predicted_ratings = predicted_ratings.drop_duplicates(subset=["product_id"])
+    return predicted_ratings.head(num_recs).reset_index(drop=True)
+
+
+def cbf_recommendations(pipeline, user_id: str, data: pd.DataFrame,
+                        num_recs: int = 10) -> pd.DataFrame:
+    """Generates content-based recommendations for a given user.
+
+    Args:
+        pipeline: The trained content-based filtering pipeline.
+        user_id (str): The ID of the user for whom recommendations are to be generated.
+        data (pd.DataFrame): The dataframe containing one-hot encoded data.
+        num_recs (int): Number of recommendations to return.
+
+    Returns:
+        pd.DataFrame: Top recommendations with "product_id" and "predicted_rating" columns.
+    """
+    user_interactions = data[data["user_id"] == user_id]["product_id"].values
+    x_new = data[~data["product_id"].isin(user_interactions)]
+    x_new = x_new.drop(columns=["rating", "user_id"])
+
+    predictions = pipeline.predict(x_new)
+
+    predicted_ratings = pd.DataFrame({"product_id": x_new["product_id"],
+                                      "predicted_rating": predictions})
+    predicted_ratings.sort_values(by="predicted_rating", ascending=False, inplace=True)
+    predicted_ratings = predicted_ratings.drop_duplicates(subset=["product_id"])
+    return predicted_ratings.head(num_recs).reset_index(drop=True)
+
+
+def popular_recommendations(data: pd.DataFrame, num_recs: int = 10) -> pd.DataFrame:
+    """Ranks products by number of ratings, then by mean rating.
+
+    Args:
+        data (pd.DataFrame): The dataframe containing one-hot encoded data.
+        num_recs (int): Number of recommendations to return.
+
+    Returns:
+        pd.DataFrame: Most popular products with "product_id" and "predicted_rating"
+        columns, where "predicted_rating" is the mean rating of the product.
+    """
+    ratings = pd.to_numeric(data["rating"])
+    popularity = ratings.groupby(data["product_id"]).agg(["count", "mean"]).reset_index()
+    popularity.sort_values(by=["count", "mean"], ascending=False, inplace=True)
+    popularity = popularity.rename(columns={"mean": "predicted_rating"})
+    return popularity[["product_id", "predicted_rating"]].head(num_recs).reset_index(drop=True)
@@ -2,10 +2,31 @@
 import logging
 from pathlib import Path
 import pickle
+from typing import Optional, Union
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+def model_path(artifacts: Path, model_dir: str, model_file: str,
+               version: Optional[Union[str, int]] = None) -> Path:
+    """
+    Builds the path of a model artifact, optionally inside a version directory.
+
+    Parameters:
+        artifacts (Path): The root artifacts directory.
+        model_dir (str): The directory of the model type, e.g. 'Collaborative_Filtering'.
+        model_file (str): The filename of the model, e.g. 'best_cf.pkl'.
+        version (Optional[str]): The model version, or None for the unversioned model.
+            Numeric versions read from YAML are converted to strings.
+
+    Returns:
+        Path: artifacts/model_dir/[version/]model_file
+    """
+    if version is None:
+        return artifacts / model_dir / model_file
+    return artifacts / model_dir / str(version) / model_file
+
+
 def save_model(best_model, model_filename: Path):
     """
     Saves the best model to the specified path using pickle.
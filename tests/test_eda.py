@@ -0,0 +1,66 @@
+""" Tests for the EDA module"""
+import pandas as pd
+from src.project_pipeline import eda
+
+
+def make_raw_data() -> pd.DataFrame:
+    """Builds a small raw DataFrame in the format of amazon.csv."""
+    return pd.DataFrame({
+        'product_id': ['B001', 'B002'],
+        'product_name': ['USB-C Cable (1.5m)', 'Broken Rating'],
+        'category': ['Computers&Accessories|Cables', 'Electronics|Chargers'],
+        'discounted_price': ['₹1,299', '₹399'],
+        'actual_price': ['₹2,499', '₹999'],
+        'discount_percentage': ['48%', '60%'],
+        'rating': ['4.2', '|'],
+        'rating_count': ['24,269', '1,000'],
+        'about_product': ['Fast charging! Durable: braided & tangle-free... (2-pack)', 'x'],
+        'user_id': ['U1,U2', 'U3'],
+        'user_name': ['Ann,Bob', 'Cy'],
+        'review_id': ['R1,R2', 'R3'],
+        'review_title': ['Great cable!,Works well.', 'Ok'],
+        'review_content': ['Really good; charges quickly. Would buy again!!', 'x'],
+        'img_link': ['https://example.com/1.jpg', 'https://example.com/2.jpg'],
+        'product_link': ['https://example.com/1', 'https://example.com/2'],
+    })
+
+
+def test_clean_text_strips_punctuation_and_lowercases():
+    text = pd.Series(['Hello, World!', 'Tangle-free... (2-Pack)'])
+    result = eda.clean_text(text, eda.PUNCTUATION_PATTERN)
+    assert result.tolist() == ['hello world', 'tanglefree 2pack']
+
+
+def test_clean_text_keeps_commas_in_review_titles():
+    text = pd.Series(['Great cable!,Works well.,Not bad :)'])
+    result = eda.clean_text(text, eda.REVIEW_TITLE_PATTERN)
+    assert result.tolist() == ['great cable,works well,not bad ']
+
+
+def test_data_preprocess_parses_prices_and_counts():
+    result = eda.data_preprocess(make_raw_data())
+    assert result['discounted_price'].tolist() == [1299.0]
+    assert result['actual_price'].tolist() == [2499.0]
+    assert result['discount_percentage'].tolist() == [48.0]
+    assert result['rating'].tolist() == [4.2]
+    assert result['rating_count'].tolist() == [24269]
+
+
+def test_data_preprocess_drops_unparseable_ratings():
+    result = eda.data_preprocess(make_raw_data())
+    assert result['product_id'].tolist() == ['B001']
+
+
+def test_data_preprocess_cleans_text_columns():
+    result = eda.data_preprocess(make_raw_data())
+    assert result['product_name'].tolist() == ['usb-c cable (1.5m)']
+    assert result['about_product'].tolist() == ['fast charging durable braided  tanglefree 2pack']
+    assert result['review_content'].tolist() == ['really good charges quickly would buy again']
+    assert result['review_title'].tolist() == ['great cable,works well']
+
+
+def test_review_titles_still_split_per_user():
+    processed = eda.data_preprocess(make_raw_data())
+    user_split = eda.split_users(processed.iloc[0])
+    assert user_split['user_id'].tolist() == ['U1', 'U2']
+    assert user_split['review_title'].tolist() == ['great cable', 'works well']
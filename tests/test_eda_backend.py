@@ -0,0 +1,68 @@
+""" Tests for the EDA backend module"""
+import pandas as pd
+import pytest
+from src.project_pipeline import eda_backend
+
+
+def make_raw_data(ratings) -> pd.DataFrame:
+    """Builds a raw DataFrame in the format of amazon.csv with one product per rating."""
+    n_rows = len(ratings)
+    return pd.DataFrame({
+        'product_id': [f'B{i:03d}' for i in range(n_rows)],
+        'product_name': [f'Cable {i} (1.5m)' for i in range(n_rows)],
+        'category': [f'Computers&Accessories|Cables|Type{i % 3}' for i in range(n_rows)],
+        'discounted_price': [f'₹{1000 + i:,}' for i in range(n_rows)],
+        'actual_price': [f'₹{2000 + i:,}' for i in range(n_rows)],
+        'discount_percentage': [f'{i % 90}%' for i in range(n_rows)],
+        'rating': ratings,
+        'rating_count': [f'{10000 + i:,}' for i in range(n_rows)],
+        'about_product': ['Fast charging! Durable.'] * n_rows,
+        'user_id': [f'U{i}a,U{i}b' for i in range(n_rows)],
+        'user_name': [f'Ann{i},Bob{i}' for i in range(n_rows)],
+        'review_id': [f'R{i}a,R{i}b' for i in range(n_rows)],
+        'review_title': ['Great cable!,Works well.'] * n_rows,
+        'review_content': ['Really good; would buy again!!'] * n_rows,
+        'img_link': [f'https://example.com/{i}.jpg' for i in range(n_rows)],
+        'product_link': [f'https://example.com/{i}' for i in range(n_rows)],
+    })
+
+
+RATINGS = ['4.2', '3.9', '|', '4.5', '5.0', '2.1', '4.0']
+
+
+@pytest.mark.parametrize('n_workers', [1, 2, 3])
+def test_process_pool_matches_pandas(n_workers):
+    expected = eda_backend.preprocess(make_raw_data(RATINGS), 'pandas')
+    result = eda_backend.preprocess(make_raw_data(RATINGS), 'process_pool', n_workers)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_process_pool_skips_partitions_without_rows():
+    ratings = ['|', '|', '4.5', '5.0']
+    expected = eda_backend.preprocess(make_raw_data(ratings), 'pandas')
+    result = eda_backend.preprocess(make_raw_data(ratings), 'process_pool', 2, 2)
+    pd.testing.assert_frame_equal(result, expected)
+    assert result['product_id'].unique().tolist() == ['B002', 'B003']
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'process_pool'])
+def test_no_rows_left_raises(backend):
+    with pytest.raises(ValueError, match='No rows left after preprocessing'):
+        eda_backend.preprocess(make_raw_data(['|', '|']), backend, 2)
+
+
+def test_partition_data_distributes_remainder_to_first_partitions():
+    data = pd.DataFrame({'x': range(10)})
+    partitions = eda_backend.partition_data(data, 3)
+    assert [part['x'].tolist() for part in partitions] == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+
+def test_partition_data_caps_partitions_at_row_count():
+    data = pd.DataFrame({'x': range(2)})
+    partitions = eda_backend.partition_data(data, 5)
+    assert [part['x'].tolist() for part in partitions] == [[0], [1]]
+
+
+def test_unknown_backend_raises():
+    with pytest.raises(ValueError, match="Unknown preprocessing backend 'dask'"):
+        eda_backend.preprocess(make_raw_data(RATINGS), 'dask')
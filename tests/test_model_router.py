@@ -0,0 +1,176 @@
+""" Tests for the model router module"""
+import threading
+import pandas as pd
+import pytest
+from src.project_pipeline.model_router import ModelRouter, summarize_metrics
+
+PRIMARY = pd.DataFrame({'product_id': ['a', 'b'], 'predicted_rating': [4.0, 3.0]})
+CANDIDATE = pd.DataFrame({'product_id': ['a', 'c'], 'predicted_rating': [5.0, 3.0]})
+POPULAR = pd.DataFrame({'product_id': ['p'], 'predicted_rating': [4.5]})
+
+
+class BlockingScorer:
+    """Scorer that blocks until released and counts its calls."""
+
+    def __init__(self, result: pd.DataFrame):
+        self.result = result
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, user_id: str) -> pd.DataFrame:
+        self.calls += 1
+        self.release.wait(timeout=5)
+        return self.result
+
+
+@pytest.fixture(name='metrics_path')
+def fixture_metrics_path(tmp_path):
+    return tmp_path / 'logs' / 'serving_metrics.csv'
+
+
+def make_router(primary, metrics_path, model='Collaborative_Filtering', **kwargs) -> ModelRouter:
+    return ModelRouter(model, primary, 'v1', lambda user_id: POPULAR, 100,
+                       metrics_path=metrics_path, **kwargs)
+
+
+def read_metrics(metrics_path) -> pd.DataFrame:
+    return pd.read_csv(metrics_path)
+
+
+def test_primary_within_budget_is_served(metrics_path):
+    router = make_router(lambda user_id: PRIMARY, metrics_path)
+    recommendations, record = router.recommend('u1')
+    router.shutdown(wait=True)
+
+    pd.testing.assert_frame_equal(recommendations, PRIMARY)
+    assert record['model'] == 'Collaborative_Filtering'
+    assert record['role'] == 'primary'
+    assert record['version'] == 'v1'
+    assert not record['timed_out']
+    assert record['mean_score'] == 3.5
+    assert read_metrics(metrics_path)['role'].tolist() == ['primary']
+
+
+def test_timeout_serves_fallback_and_records_late_primary(metrics_path):
+    primary = BlockingScorer(PRIMARY)
+    router = make_router(primary, metrics_path)
+    recommendations, record = router.recommend('u1')
+    primary.release.set()
+    router.shutdown(wait=True)
+
+    pd.testing.assert_frame_equal(recommendations, POPULAR)
+    assert record['role'] == 'fallback'
+    metrics = read_metrics(metrics_path).set_index('role')
+    assert bool(metrics.loc['primary', 'timed_out'])
+    assert metrics.loc['primary', 'latency_ms'] >= metrics.loc['fallback', 'latency_ms']
+
+
+def test_timeout_cancels_queued_primary_scores(metrics_path):
+    primary = BlockingScorer(PRIMARY)
+    router = make_router(primary, metrics_path, primary_workers=1)
+    for user_id in ['u1', 'u2', 'u3']:
+        assert router.recommend(user_id)[1]['role'] == 'fallback'
+    primary.release.set()
+    router.shutdown(wait=True)
+
+    assert primary.calls == 1
+    primary_rows = read_metrics(metrics_path).query("role == 'primary'")
+    assert len(primary_rows) == 3
+    assert primary_rows['timed_out'].all()
+    assert (primary_rows['latency_ms'] >= 100).all()
+
+
+def test_candidate_diffs_against_primary(metrics_path):
+    router = make_router(lambda user_id: PRIMARY, metrics_path,
+                         candidate=lambda user_id: CANDIDATE, candidate_version='v2')
+    router.recommend('u1')
+    router.shutdown(wait=True)
+
+    candidate = read_metrics(metrics_path).query("role == 'candidate'").iloc[0]
+    assert candidate['version'] == 'v2'
+    assert candidate['score_diff'] == pytest.approx(0.5)
+    assert candidate['overlap'] == pytest.approx(0.5)
+    assert not pd.isna(candidate['latency_diff_ms'])
+
+
+def test_candidate_diffs_against_late_primary(metrics_path):
+    primary = BlockingScorer(PRIMARY)
+    router = make_router(primary, metrics_path,
+                         candidate=lambda user_id: CANDIDATE, candidate_version='v2')
+    router.recommend('u1')
+    primary.release.set()
+    router.shutdown(wait=True)
+
+    metrics = read_metrics(metrics_path).set_index('role')
+    assert metrics.loc['candidate', 'score_diff'] == pytest.approx(0.5)
+    assert metrics.loc['candidate', 'latency_diff_ms'] < 0
+
+
+def test_shadow_scores_over_limit_are_dropped(metrics_path):
+    candidate = BlockingScorer(CANDIDATE)
+    router = make_router(lambda user_id: PRIMARY, metrics_path,
+                         candidate=candidate, candidate_version='v2', shadow_workers=1)
+    for user_id in ['u1', 'u2', 'u3']:
+        assert router.recommend(user_id)[1]['role'] == 'primary'
+    candidate.release.set()
+    router.shutdown(wait=True)
+
+    assert router.shadow_dropped == 2
+    assert candidate.calls == 1
+    assert read_metrics(metrics_path)['role'].tolist().count('candidate') == 1
+
+
+def test_metrics_header_written_once(metrics_path):
+    router = make_router(lambda user_id: PRIMARY, metrics_path)
+    router.recommend('u1')
+    router.recommend('u2')
+    router.shutdown(wait=True)
+
+    lines = metrics_path.read_text(encoding='utf8').splitlines()
+    assert len(lines) == 3
+    assert lines[0].startswith('timestamp,')
+    assert sum(line.startswith('timestamp,') for line in lines) == 1
+
+
+def test_summarize_metrics_per_version(metrics_path):
+    primary = BlockingScorer(PRIMARY)
+    router = make_router(primary, metrics_path,
+                         candidate=lambda user_id: CANDIDATE, candidate_version='v2')
+    primary.release.set()
+    router.recommend('u1')
+    primary.release.clear()
+    router.recommend('u2')
+    primary.release.set()
+    router.shutdown(wait=True)
+
+    summary = summarize_metrics(read_metrics(metrics_path)).set_index(['role', 'version'])
+    assert (summary['model'] == 'Collaborative_Filtering').all()
+    assert summary.loc[('primary', 'v1'), 'requests'] == 2
+    assert summary.loc[('primary', 'v1'), 'timeout_rate'] == 0.5
+    assert summary.loc[('fallback', 'popularity'), 'requests'] == 1
+    assert summary.loc[('candidate', 'v2'), 'requests'] == 2
+    assert summary.loc[('candidate', 'v2'), 'mean_score_diff'] == pytest.approx(0.5)
+    assert summary.loc[('candidate', 'v2'), 'mean_overlap'] == pytest.approx(0.5)
+
+
+def test_routers_sharing_a_metrics_file(metrics_path):
+    routers = [make_router(lambda user_id: PRIMARY, metrics_path, model=model)
+               for model in ['Collaborative_Filtering', 'Content_Based_Filtering']]
+    threads = [threading.Thread(target=lambda router=router: [router.recommend(f'u{i}')
+                                                              for i in range(20)])
+               for router in routers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for router in routers:
+        router.shutdown(wait=True)
+
+    lines = metrics_path.read_text(encoding='utf8').splitlines()
+    assert sum(line.startswith('timestamp,') for line in lines) == 1
+    summary = summarize_metrics(read_metrics(metrics_path))
+    assert summary[['model', 'role', 'version']].values.tolist() == [
+        ['Collaborative_Filtering', 'primary', 'v1'],
+        ['Content_Based_Filtering', 'primary', 'v1'],
+    ]
+    assert summary['requests'].tolist() == [20, 20]
@@ -0,0 +1,14 @@
+""" Tests for the recommend module"""
+import pandas as pd
+from src.project_pipeline import recommend
+
+
+def test_popular_recommendations_rank_by_count_then_mean_rating():
+    data = pd.DataFrame({
+        'product_id': ['a', 'a', 'b', 'c', 'c', 'c', 'd'],
+        'rating': ['4.0', '5.0', '5.0', '3.0', '3.0', '3.0', '4.0'],
+        'user_id': ['u1', 'u2', 'u3', 'u4', 'u5', 'u6', 'u7'],
+    })
+    result = recommend.popular_recommendations(data, num_recs=3)
+    assert result['product_id'].tolist() == ['c', 'a', 'b']
+    assert result['predicted_rating'].tolist() == [3.0, 4.5, 5.0]
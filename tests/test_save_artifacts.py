@@ -0,0 +1,14 @@
+""" Tests for the save artifacts module"""
+from pathlib import Path
+from src.project_pipeline import save_artifacts
+
+
+def test_model_path_unversioned():
+    path = save_artifacts.model_path(Path('artifacts'), 'Collaborative_Filtering', 'best_cf.pkl')
+    assert path == Path('artifacts/Collaborative_Filtering/best_cf.pkl')
+
+
+def test_model_path_accepts_numeric_versions():
+    path = save_artifacts.model_path(Path('artifacts'), 'Collaborative_Filtering',
+                                     'best_cf.pkl', 2)
+    assert path == Path('artifacts/Collaborative_Filtering/2/best_cf.pkl')